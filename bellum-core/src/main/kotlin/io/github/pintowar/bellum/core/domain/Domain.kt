@@ -53,3 +53,29 @@ fun List<AssignedTask>.hasOverlappingIntervals(): Boolean {
     // If the loop completes without finding any overlaps, return false.
     return false
 }
+
+/**
+ * Counts priority inversions: pairs of tasks where the lower priority one (higher [TaskPriority.value])
+ * starts strictly before the higher priority one.
+ *
+ * Shared by [Project.priorityCost] and the Jenetics decoder, so every caller scores schedules the same way.
+ *
+ * @param priorities The [TaskPriority.value] of each task.
+ * @param starts The start time of each task, in any unit, index-aligned with [priorities].
+ * @return The total number of priority inversions.
+ */
+fun countPriorityInversions(
+    priorities: IntArray,
+    starts: LongArray,
+): Long {
+    var cost = 0L
+    for (i in priorities.indices) {
+        for (j in i + 1 until priorities.size) {
+            val p1 = priorities[i]
+            val p2 = priorities[j]
+            if (p1 > p2 && starts[i] < starts[j]) cost++
+            if (p2 > p1 && starts[j] < starts[i]) cost++
+        }
+    }
+    return cost
+}
@@ -81,19 +81,10 @@ class Project private constructor(
 
     val priorityCost: Long by lazy {
         val assigned = tasks.filterIsInstance<AssignedTask>()
-        var cost = 0L
-        for (i in 0 until assigned.size) {
-            for (j in i + 1 until assigned.size) {
-                val t1 = assigned[i]
-                val t2 = assigned[j]
-                if (t1.startAt < t2.startAt && t1.priority.value > t2.priority.value) {
-                    cost++
-                } else if (t2.startAt < t1.startAt && t2.priority.value > t1.priority.value) {
-                    cost++
-                }
-            }
-        }
-        cost
+        countPriorityInversions(
+            IntArray(assigned.size) { assigned[it].priority.value },
+            LongArray(assigned.size) { (assigned[it].startAt - kickOff).inWholeNanoseconds },
+        )
     }
 
     fun validate(): ValidationResult = validator.validate(this).toDomain()
@@ -150,7 +141,6 @@ class Project private constructor(
 
         val precedence =
             tasks
-                .asSequence()
                 .filter { it.dependsOn != null }
                 .map { it.id to it.dependsOn!!.id }
 
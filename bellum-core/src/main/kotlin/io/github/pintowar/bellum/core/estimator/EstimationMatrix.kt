@@ -5,6 +5,7 @@ import io.github.pintowar.bellum.core.domain.EmployeeId
 import io.github.pintowar.bellum.core.domain.Project
 import io.github.pintowar.bellum.core.domain.Task
 import io.github.pintowar.bellum.core.domain.TaskId
+import java.util.concurrent.ConcurrentHashMap
 import kotlin.time.Duration
 
 class EstimationMatrix private constructor(
@@ -12,7 +13,8 @@ class EstimationMatrix private constructor(
     private val taskIds: Map<TaskId, Task>,
     private val estimator: TimeEstimator,
 ) {
-    private val matrix: MutableMap<Pair<EmployeeId, TaskId>, Duration> = mutableMapOf()
+    // concurrent so a single matrix can be shared by parallel solver workers
+    private val matrix: MutableMap<Pair<EmployeeId, TaskId>, Duration> = ConcurrentHashMap()
 
     companion object {
         operator fun invoke(
@@ -3,14 +3,17 @@ package io.github.pintowar.bellum.core.solver
 import java.util.ServiceLoader
 
 object SchedulerRegistry {
-    private val loader = ServiceLoader.load(SolverDescriptor::class.java)
+    private val solvers: List<SolverDescriptor> by lazy {
+        ServiceLoader.load(SolverDescriptor::class.java).toList()
+    }
 
-    fun availableSolvers(): List<SolverDescriptor> = loader.toList()
+    private val solversByName: Map<String, SolverDescriptor> by lazy {
+        solvers.distinctBy { it.name.lowercase() }.associateBy { it.name.lowercase() }
+    }
 
-    fun getSolver(name: String): SolverDescriptor? =
-        availableSolvers().find {
-            it.name.equals(name, ignoreCase = true)
-        }
+    fun availableSolvers(): List<SolverDescriptor> = solvers
+
+    fun getSolver(name: String): SolverDescriptor? = solversByName[name.lowercase()]
 
     fun getSolverOrThrow(name: String): SolverDescriptor =
         getSolver(name)
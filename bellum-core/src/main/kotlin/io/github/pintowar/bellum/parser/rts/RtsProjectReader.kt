@@ -58,28 +58,20 @@ class RtsProjectReader(
             }
 
             val lines = trimmedContent.lines()
-            val separatorIndices =
-                lines.mapIndexedNotNull { idx, line ->
-                    if (isSeparatorLine(line)) idx else null
-                }
+            val firstSepIdx = lines.indexOfFirst { isSeparatorLine(it) }
 
-            if (separatorIndices.isEmpty()) {
+            if (firstSepIdx < 0) {
                 throw InvalidFileFormat("Missing separator line.")
             }
 
-            val firstSepIdx = separatorIndices.first()
-
-            val employeeLines = lines.take(firstSepIdx)
-            val afterFirstSep = lines.drop(firstSepIdx + 1)
+            val employeeLines = lines.subList(0, firstSepIdx)
+            val afterFirstSep = lines.subList(firstSepIdx + 1, lines.size)
 
-            val secondSepIdx =
-                separatorIndices.getOrNull(1)?.let { secondIdx ->
-                    secondIdx - firstSepIdx - 1
-                }
+            val secondSepIdx = afterFirstSep.indexOfFirst { isSeparatorLine(it) }
 
             val (taskLines, matrixLines) =
-                if (secondSepIdx != null && secondSepIdx > 0) {
-                    afterFirstSep.take(secondSepIdx) to afterFirstSep.drop(secondSepIdx + 1)
+                if (secondSepIdx > 0) {
+                    afterFirstSep.subList(0, secondSepIdx) to afterFirstSep.subList(secondSepIdx + 1, afterFirstSep.size)
                 } else {
                     afterFirstSep to emptyList()
                 }
@@ -3,6 +3,7 @@ package io.github.pintowar.bellum.plotter
 import io.github.pintowar.bellum.core.domain.AssignedTask
 import io.github.pintowar.bellum.core.domain.Employee
 import io.github.pintowar.bellum.core.domain.Project
+import io.github.pintowar.bellum.core.domain.TaskPriority
 import kotlin.math.min
 
 object CliPlotter {
@@ -14,12 +15,16 @@ object CliPlotter {
     private const val TXT_WHITE = "\u001b[97m"
     private const val TXT_GREY = "\u001b[90m"
 
+    // indexed by TaskPriority.ordinal
     private val COLORS =
-        mapOf(
-            "MINOR" to BG_GREEN,
-            "MAJOR" to BG_BLUE,
-            "CRITICAL" to BG_RED,
-        )
+        TaskPriority.entries
+            .map {
+                when (it) {
+                    TaskPriority.CRITICAL -> BG_RED
+                    TaskPriority.MAJOR -> BG_BLUE
+                    TaskPriority.MINOR -> BG_GREEN
+                }
+            }.toTypedArray()
 
     private const val NAME_PADDING = 8
     private const val MIN_TASK_WIDTH = 1
@@ -48,11 +53,12 @@ object CliPlotter {
                 else -> RULER_STEP_SMALL
             }
         val rulerMarks = (0..projectDuration step rulerStep)
-        val gridLineIndexes = rulerMarks.map { (it / scale).toInt() }.toSet()
+        val gridLineIndexes = rulerMarks.map { (it / scale).toInt() }.distinct().toIntArray()
 
         val (rulerHeader, rulerLine) = buildRuler(rulerMarks, scale, width)
 
         val namePadding = " ".repeat(NAME_PADDING)
+        val separator = "$namePadding$TXT_GREY${"-".repeat(width)}$BG_RESET"
 
         val body =
             project
@@ -60,12 +66,12 @@ object CliPlotter {
                 .entries
                 .joinToString("\n") { (employee, tasks) ->
                     val employeeRow = buildEmployeeRow(tasks, project, scale, width, gridLineIndexes)
-                    val separator = "$namePadding$TXT_GREY${"-".repeat(width)}$BG_RESET"
                     "${employeeName(employee)} $employeeRow\n$separator"
                 }
 
         val legend =
-            "\nLegend: [${COLORS["MINOR"]} MINOR $BG_RESET] [${COLORS["MAJOR"]} MAJOR $BG_RESET] [${COLORS["CRITICAL"]} CRITICAL $BG_RESET]"
+            listOf(TaskPriority.MINOR, TaskPriority.MAJOR, TaskPriority.CRITICAL)
+                .joinToString(" ", prefix = "\nLegend: ") { "[${color(it)} ${it.name} $BG_RESET]" }
 
         return buildString {
             appendLine()
@@ -114,7 +120,7 @@ object CliPlotter {
         project: Project,
         scale: Double,
         width: Int,
-        gridLineIndexes: Set<Int>,
+        gridLineIndexes: IntArray,
     ): String {
         val line = StringBuilder(width)
         var currentCharIdx = 0
@@ -126,9 +132,7 @@ object CliPlotter {
             val taskStartIdx = (taskStart / scale).toInt()
 
             val gapEnd = min(taskStartIdx, width)
-            (currentCharIdx until gapEnd).forEach { i ->
-                line.append(if (i in gridLineIndexes) "$TXT_GREY|$BG_RESET" else " ")
-            }
+            appendGap(line, currentCharIdx, gapEnd, gridLineIndexes)
             currentCharIdx = gapEnd
             if (currentCharIdx >= width) return@forEach
 
@@ -142,13 +146,35 @@ object CliPlotter {
             currentCharIdx += effectiveTaskWidth
         }
 
-        (currentCharIdx until width).forEach { i ->
-            line.append(if (i in gridLineIndexes) "$TXT_GREY|$BG_RESET" else " ")
-        }
+        appendGap(line, currentCharIdx, width, gridLineIndexes)
 
         return line.toString()
     }
 
+    /**
+     * Fills the `[from, until)` columns of a row with blank runs, breaking only where a ruler grid line falls.
+     * [gridLineIndexes] must be sorted in ascending order.
+     */
+    private fun appendGap(
+        line: StringBuilder,
+        from: Int,
+        until: Int,
+        gridLineIndexes: IntArray,
+    ) {
+        if (from >= until) return
+
+        var pos = from
+        var gridIdx = gridLineIndexes.binarySearch(from).let { if (it < 0) -it - 1 else it }
+        while (gridIdx < gridLineIndexes.size && gridLineIndexes[gridIdx] < until) {
+            val gridLine = gridLineIndexes[gridIdx]
+            line.append(" ".repeat(gridLine - pos))
+            line.append("$TXT_GREY|$BG_RESET")
+            pos = gridLine + 1
+            gridIdx++
+        }
+        line.append(" ".repeat(until - pos))
+    }
+
     private fun buildTaskContent(
         task: AssignedTask,
         taskWidth: Int,
@@ -163,9 +189,10 @@ object CliPlotter {
 
         val textContent = " ".repeat(paddingLeft) + truncatedLabel + " ".repeat(paddingRight)
 
-        val colorCode = COLORS[task.priority.name] ?: BG_RESET
-        return "$colorCode$TXT_WHITE$textContent$BG_RESET"
+        return "${color(task.priority)}$TXT_WHITE$textContent$BG_RESET"
     }
+
+    private fun color(priority: TaskPriority): String = COLORS[priority.ordinal]
 }
 
 fun Project.cliGantt(width: Int = 100) = CliPlotter.generateCliPlot(this, width)
@@ -1,8 +1,27 @@
 package io.github.pintowar.bellum.report
 
 object SolverTemplate {
-    fun generateHtml(jsonData: String): String {
-        val template = SolverTemplate::class.java.getResource("/report/solver.tpl.html")?.readText() ?: ""
-        return template.replace("[[jsonData]]", jsonData)
+    private const val PLACEHOLDER = "[[jsonData]]"
+
+    private val template: String by lazy {
+        SolverTemplate::class.java.getResource("/report/solver.tpl.html")?.readText() ?: ""
+    }
+
+    /**
+     * Writes the report straight into [out], without materializing the whole page in memory first.
+     */
+    fun writeHtml(
+        jsonData: String,
+        out: Appendable,
+    ) {
+        val idx = template.indexOf(PLACEHOLDER)
+        if (idx < 0) {
+            out.append(template)
+        } else {
+            out
+                .append(template, 0, idx)
+                .append(jsonData)
+                .append(template, idx + PLACEHOLDER.length, template.length)
+        }
     }
 }
@@ -99,12 +99,12 @@ sealed class SolverStats {
         constructor(stats: Map<String, Any>) : this(
             stats.getValue("model name").toString(),
             stats.getValue("search state").toString(),
-            stats.getValue("solutions").toString().toInt(),
-            stats.getValue("objective").toString().toLong(),
-            stats.getValue("nodes").toString().toLong(),
-            stats.getValue("backtracks").toString().toLong(),
-            stats.getValue("fails").toString().toLong(),
-            stats.getValue("restarts").toString().toLong(),
+            stats.int("solutions"),
+            stats.long("objective"),
+            stats.long("nodes"),
+            stats.long("backtracks"),
+            stats.long("fails"),
+            stats.long("restarts"),
         )
     }
 
@@ -121,15 +121,22 @@ sealed class SolverStats {
         val invalidCount: Long,
     ) : SolverStats() {
         constructor(stats: Map<String, Any>) : this(
-            stats.getValue("fitness").toString().toLong(),
-            stats.getValue("generations").toString().toLong(),
-            stats.getValue("fitnessMin").toString().toDouble(),
-            stats.getValue("fitnessMax").toString().toDouble(),
-            stats.getValue("fitnessMean").toString().toDouble(),
-            stats.getValue("fitnessVariance").toString().toDouble(),
-            stats.getValue("alteredCount").toString().toLong(),
-            stats.getValue("killedCount").toString().toLong(),
-            stats.getValue("invalidCount").toString().toLong(),
+            stats.long("fitness"),
+            stats.long("generations"),
+            stats.double("fitnessMin"),
+            stats.double("fitnessMax"),
+            stats.double("fitnessMean"),
+            stats.double("fitnessVariance"),
+            stats.long("alteredCount"),
+            stats.long("killedCount"),
+            stats.long("invalidCount"),
         )
     }
 }
+
+// solvers report their stats as boxed numbers; only values that arrive as text need to be parsed
+private fun Map<String, Any>.int(key: String): Int = getValue(key).let { (it as? Number)?.toInt() ?: it.toString().toInt() }
+
+private fun Map<String, Any>.long(key: String): Long = getValue(key).let { (it as? Number)?.toLong() ?: it.toString().toLong() }
+
+private fun Map<String, Any>.double(key: String): Double = getValue(key).let { (it as? Number)?.toDouble() ?: it.toString().toDouble() }
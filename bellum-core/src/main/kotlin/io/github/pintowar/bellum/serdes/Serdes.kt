@@ -7,8 +7,8 @@ import kotlinx.serialization.json.JsonElement
 import kotlinx.serialization.json.encodeToJsonElement
 import java.nio.file.Files
 import kotlin.io.path.Path
+import kotlin.io.path.bufferedWriter
 import kotlin.io.path.notExists
-import kotlin.io.path.writeBytes
 
 object Serdes {
     private val json =
@@ -59,6 +59,5 @@ fun JsonElement.export(fileName: String) {
         }
     }
 
-    val outputHtml = SolverTemplate.generateHtml(this.toString())
-    file.writeBytes(outputHtml.toByteArray())
+    file.bufferedWriter().use { SolverTemplate.writeHtml(this.toString(), it) }
 }
@@ -0,0 +1,28 @@
+package io.github.pintowar.bellum.core.domain
+
+import io.kotest.core.spec.style.FunSpec
+import io.kotest.matchers.shouldBe
+
+class DomainTest :
+    FunSpec({
+        context("countPriorityInversions") {
+            test("should be zero for empty input") {
+                countPriorityInversions(intArrayOf(), longArrayOf()) shouldBe 0L
+            }
+
+            test("should be zero when higher priorities start first") {
+                val priorities = intArrayOf(TaskPriority.CRITICAL.value, TaskPriority.MAJOR.value, TaskPriority.MINOR.value)
+                countPriorityInversions(priorities, longArrayOf(0, 10, 20)) shouldBe 0L
+            }
+
+            test("should count every pair where a lower priority starts earlier") {
+                val priorities = intArrayOf(TaskPriority.CRITICAL.value, TaskPriority.MAJOR.value, TaskPriority.MINOR.value)
+                countPriorityInversions(priorities, longArrayOf(20, 10, 0)) shouldBe 3L
+            }
+
+            test("should ignore tasks starting at the same time or sharing a priority") {
+                val priorities = intArrayOf(TaskPriority.MINOR.value, TaskPriority.CRITICAL.value, TaskPriority.MINOR.value)
+                countPriorityInversions(priorities, longArrayOf(5, 5, 0)) shouldBe 1L
+            }
+        }
+    })
@@ -411,5 +411,30 @@ class SerdesTest :
                 jsonString shouldContain "\"restarts\":5"
                 jsonString shouldContain "\"optimal\":true"
             }
+
+            test("should handle JeneticsStats constructor with numeric values") {
+                val solverStats =
+                    mapOf(
+                        "solver" to "Jenetics",
+                        "fitness" to 1200L,
+                        "generations" to 42L,
+                        "fitnessMin" to 1200.0,
+                        "fitnessMax" to 3000.0,
+                        "fitnessMean" to 2100.5,
+                        "fitnessVariance" to 12.25,
+                        "alteredCount" to 7L,
+                        "killedCount" to 0L,
+                        "invalidCount" to 1,
+                    )
+
+                val stats = SolverStats.JeneticsStats(solverStats)
+
+                stats.fitness shouldBe 1200L
+                stats.generations shouldBe 42L
+                stats.fitnessMean shouldBe 2100.5
+                stats.fitnessVariance shouldBe 12.25
+                stats.alteredCount shouldBe 7L
+                stats.invalidCount shouldBe 1L
+            }
         }
     })
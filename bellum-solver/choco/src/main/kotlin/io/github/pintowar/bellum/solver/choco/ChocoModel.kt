@@ -5,6 +5,7 @@ import io.github.pintowar.bellum.core.domain.Employee
 import io.github.pintowar.bellum.core.domain.Project
 import io.github.pintowar.bellum.core.domain.ProjectScheduled
 import io.github.pintowar.bellum.core.domain.Task
+import io.github.pintowar.bellum.core.estimator.EstimationMatrix
 import io.github.pintowar.bellum.core.estimator.TimeEstimator
 import io.github.pintowar.bellum.core.solver.SchedulerSolution
 import org.chocosolver.solver.Model
@@ -19,6 +20,7 @@ import org.chocosolver.solver.search.strategy.selectors.variables.FirstFail
 import org.chocosolver.solver.search.strategy.selectors.variables.Smallest
 import org.chocosolver.solver.variables.BoolVar
 import org.chocosolver.solver.variables.IntVar
+import java.util.stream.IntStream
 import kotlin.time.Duration
 import kotlin.time.Duration.Companion.minutes
 
@@ -30,13 +32,15 @@ import kotlin.time.Duration.Companion.minutes
  * respecting various constraints and optimizing for certain objectives.
  *
  * @param project The project containing the tasks and employees to be scheduled.
- * @param estimator A [TimeEstimator] used to determine the duration of a task for a given employee.
+ * @param estimations An [EstimationMatrix] used to determine the duration of a task for a given employee.
  */
 internal class ChocoModel(
     private val project: Project,
-    estimator: TimeEstimator,
+    estimations: EstimationMatrix,
     idx: Int = 0,
 ) {
+    constructor(project: Project, estimator: TimeEstimator, idx: Int = 0) : this(project, EstimationMatrix(project, estimator), idx)
+
     companion object {
         fun portfolio(
             project: Project,
@@ -45,7 +49,13 @@ internal class ChocoModel(
             timeLimit: Duration,
         ): Pair<ParallelPortfolio, List<ChocoModel>> {
             val portfolio = ParallelPortfolio()
-            val chocoModels = List(numThreads) { ChocoModel(project, estimator, it) }
+            val estimations = EstimationMatrix(project, estimator)
+            val chocoModels =
+                IntStream
+                    .range(0, numThreads)
+                    .parallel()
+                    .mapToObj { ChocoModel(project, estimations, it) }
+                    .toList()
             chocoModels.forEach { chocoModel ->
                 chocoModel.model.solver.limitTime(timeLimit.inWholeMilliseconds)
                 portfolio.addModel(chocoModel.model)
@@ -95,7 +105,7 @@ internal class ChocoModel(
      * A 2D matrix where `taskDurationMatrix[e][t]` holds the estimated time (in minutes)
      * for employee `e` to complete task `t`.
      */
-    private val taskDurationMatrix = createDurationMatrix(employees, tasks, estimator).getOrThrow()
+    private val taskDurationMatrix = createDurationMatrix(employees, tasks, estimations).getOrThrow()
 
     /**
      * An array containing the priority value for each task.
@@ -553,18 +563,18 @@ internal class ChocoModel(
      *
      * @param employees The list of employees.
      * @param tasks The list of tasks.
-     * @param estimator The time estimator.
+     * @param estimations The (memoized) estimation matrix.
      * @return A [Result] containing the 2D integer array of durations or an error.
      */
     private fun createDurationMatrix(
         employees: List<Employee>,
         tasks: List<Task>,
-        estimator: TimeEstimator,
+        estimations: EstimationMatrix,
     ): Result<Array<IntArray>> =
         runCatching {
             employees
                 .map { emp ->
-                    tasks.map { tsk -> durationUnit(estimator.estimate(emp, tsk).getOrThrow()) }.toIntArray()
+                    tasks.map { tsk -> durationUnit(estimations.duration(emp.id, tsk.id).getOrThrow()) }.toIntArray()
                 }.toTypedArray()
         }
 
@@ -15,6 +15,7 @@ import io.jenetics.engine.EvolutionStatistics
 import io.jenetics.engine.Limits
 import io.jenetics.stat.DoubleMomentStatistics
 import io.jenetics.util.BatchExecutor
+import java.util.concurrent.Executor
 import java.util.concurrent.Executors
 import kotlin.time.Clock
 import kotlin.time.Duration
@@ -72,26 +73,32 @@ class JeneticsScheduler(
             }
 
             val decoder = ScheduleDecoder(project, estimator)
-            val engine = createEngine(project, decoder, realNumThreads(numThreads))
+            val workers = realNumThreads(numThreads)
+            val pool = if (workers > 1) Executors.newFixedThreadPool(workers) else null
+            val engine = createEngine(project, decoder, pool ?: Executor { it.run() })
             val statistics = EvolutionStatistics.ofNumber<Long>()
 
             var bestFitness = Long.MAX_VALUE
             val initSolving = Clock.System.now()
 
             val evolutionResult =
-                engine
-                    .stream()
-                    .limit(Limits.byExecutionTime(JavaDuration.ofMillis(timeLimit.inWholeMilliseconds)))
-                    .peek(statistics)
-                    .peek { evResult ->
-                        val currentFitness = evResult.bestPhenotype().fitness()
-                        if (currentFitness < bestFitness) {
-                            bestFitness = currentFitness
-                            val decoded = decoder.decode(extractPermutation(evResult.bestPhenotype().genotype()))
-                            val sol = createSolution(decoded.project, currentFitness, evResult.generation(), statistics, initSolving)
-                            callback(sol.copy(duration = listOf(timeLimit, sol.duration).min()))
-                        }
-                    }.collect(EvolutionResult.toBestEvolutionResult())
+                try {
+                    engine
+                        .stream()
+                        .limit(Limits.byExecutionTime(JavaDuration.ofMillis(timeLimit.inWholeMilliseconds)))
+                        .peek(statistics)
+                        .peek { evResult ->
+                            val currentFitness = evResult.bestPhenotype().fitness()
+                            if (currentFitness < bestFitness) {
+                                bestFitness = currentFitness
+                                val decoded = decoder.decode(extractPermutation(evResult.bestPhenotype().genotype()))
+                                val sol = createSolution(decoded.project, currentFitness, evResult.generation(), statistics, initSolving)
+                                callback(sol.copy(duration = listOf(timeLimit, sol.duration).min()))
+                            }
+                        }.collect(EvolutionResult.toBestEvolutionResult())
+                } finally {
+                    pool?.shutdown()
+                }
 
             val decoded = decoder.decode(extractPermutation(evolutionResult.bestPhenotype().genotype()))
             val currentDuration = listOf(timeLimit, Clock.System.now() - initSolving).min()
@@ -109,13 +116,13 @@ class JeneticsScheduler(
      *
      * @param project The project being optimized.
      * @param decoder The decoder used to convert permutations to schedules.
-     * @param numThreads Number of threads for parallel evaluation.
+     * @param executor The executor used for fitness evaluation.
      * @return A configured [Engine] ready for evolution.
      */
     private fun createEngine(
         project: Project,
         decoder: ScheduleDecoder,
-        numThreads: Int,
+        executor: Executor,
     ): Engine<EnumGene<Int>, Long> {
         val numTasks = project.allTasks().size
 
@@ -124,7 +131,7 @@ class JeneticsScheduler(
 
         return Engine
             .builder({ decoded: ScheduleDecoder.DecodedSchedule -> decoded.fitness }, codec)
-            .fitnessExecutor(BatchExecutor.of(Executors.newFixedThreadPool(numThreads)))
+            .fitnessExecutor(BatchExecutor.of(executor))
             .optimize(Optimize.MINIMUM)
             .populationSize(100)
             .alterers(
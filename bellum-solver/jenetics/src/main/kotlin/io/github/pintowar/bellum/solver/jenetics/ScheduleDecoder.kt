@@ -2,8 +2,11 @@ package io.github.pintowar.bellum.solver.jenetics
 
 import io.github.pintowar.bellum.core.domain.AssignedTask
 import io.github.pintowar.bellum.core.domain.Employee
+import io.github.pintowar.bellum.core.domain.EmployeeId
 import io.github.pintowar.bellum.core.domain.Project
 import io.github.pintowar.bellum.core.domain.Task
+import io.github.pintowar.bellum.core.domain.TaskId
+import io.github.pintowar.bellum.core.domain.countPriorityInversions
 import io.github.pintowar.bellum.core.estimator.TimeEstimator
 import kotlin.time.Duration.Companion.minutes
 
@@ -25,7 +28,7 @@ import kotlin.time.Duration.Companion.minutes
  */
 internal class ScheduleDecoder(
     private val project: Project,
-    private val estimator: TimeEstimator,
+    estimator: TimeEstimator,
 ) {
     /**
      * Represents the result of decoding a permutation into a schedule.
@@ -41,6 +44,24 @@ internal class ScheduleDecoder(
     private val tasks: List<Task> = project.allTasks()
     private val employees: List<Employee> = project.allEmployees()
     private val numTasks: Int = tasks.size
+    private val employeeIndex: Map<EmployeeId, Int> = employees.withIndex().associate { it.value.id to it.index }
+    private val taskIndex: Map<TaskId, Int> = tasks.withIndex().associate { it.value.id to it.index }
+    private val dependencies: IntArray = buildDependencyIndex()
+    private val priorities: IntArray = IntArray(numTasks) { tasks[it].priority.value }
+
+    /**
+     * A 2D matrix where `durationMatrix[e][t]` holds the estimated time (in minutes) for employee `e`
+     * to complete task `t`, or [NO_ESTIMATION] when the estimator can't handle the pair.
+     */
+    private val durationMatrix: Array<IntArray> =
+        Array(employees.size) { e ->
+            IntArray(numTasks) { t ->
+                estimator
+                    .estimate(employees[e], tasks[t])
+                    .map { it.inWholeMinutes.toInt() }
+                    .getOrDefault(NO_ESTIMATION)
+            }
+        }
 
     /**
      * Decodes a task permutation into a complete schedule.
@@ -87,7 +108,6 @@ internal class ScheduleDecoder(
         val assignees = IntArray(numTasks) { -1 }
         val unscheduled = mutableSetOf<Int>()
         val timelines = Array(employees.size) { mutableListOf<Pair<Int, Int>>() }
-        val dependencies = buildDependencyIndex()
 
         for (i in 0 until numTasks) {
             val task = tasks[i]
@@ -114,8 +134,7 @@ internal class ScheduleDecoder(
      */
     private fun buildDependencyIndex(): IntArray =
         IntArray(numTasks) { i ->
-            val depId = tasks[i].dependsOn?.id
-            if (depId != null) tasks.indexOfFirst { it.id == depId } else -1
+            tasks[i].dependsOn?.let { taskIndex[it.id] } ?: -1
         }
 
     /**
@@ -131,7 +150,7 @@ internal class ScheduleDecoder(
         for (i in 0 until numTasks) {
             val task = tasks[i]
             if (task is AssignedTask && task.pinned) {
-                val empIdx = employees.indexOfFirst { it.id == task.employee.id }.takeIf { it >= 0 } ?: 0
+                val empIdx = employeeIndex[task.employee.id] ?: 0
                 val startOffset = (task.startAt - project.kickOff).inWholeMinutes.toInt()
                 val dur = task.duration.inWholeMinutes.toInt()
 
@@ -245,17 +264,16 @@ internal class ScheduleDecoder(
         state: DecodingState,
     ): Assignment? {
         val task = tasks[taskIdx]
-        val assignedEmployeeId = (task as? AssignedTask)?.employee?.id
+        val assignedEmpIdx = (task as? AssignedTask)?.employee?.id?.let { employeeIndex[it] }
         var best: Assignment? = null
 
         for (empIdx in employees.indices) {
-            val durResult = estimator.estimate(employees[empIdx], task)
-            if (durResult.isFailure) continue
+            val duration = durationMatrix[empIdx][taskIdx]
+            if (duration == NO_ESTIMATION) continue
 
-            val duration = durResult.getOrThrow().inWholeMinutes.toInt()
             val startTime = findEarliestSlot(empIdx, readyTime, duration, state.timelines)
             val finishTime = startTime + duration
-            val isAssignedEmp = assignedEmployeeId == employees[empIdx].id
+            val isAssignedEmp = assignedEmpIdx == empIdx
 
             if (shouldUpdateBest(best, finishTime, isAssignedEmp)) {
                 best = Assignment(empIdx, startTime, duration, finishTime)
@@ -399,23 +417,8 @@ internal class ScheduleDecoder(
      * @param state The decoding state with task start times and priorities.
      * @return The total number of priority inversions.
      */
-    private fun calculatePriorityCost(state: DecodingState): Long {
-        var cost = 0L
-
-        for (i in 0 until numTasks) {
-            for (j in i + 1 until numTasks) {
-                val p1 = tasks[i].priority.value
-                val p2 = tasks[j].priority.value
-                val s1 = state.starts[i]
-                val s2 = state.starts[j]
-
-                if (p1 > p2 && s1 < s2) cost++
-                if (p2 > p1 && s2 < s1) cost++
-            }
-        }
-
-        return cost
-    }
+    private fun calculatePriorityCost(state: DecodingState): Long =
+        countPriorityInversions(priorities, LongArray(numTasks) { state.starts[it].toLong() })
 
     /**
      * Builds the final project with all tasks assigned.
@@ -487,5 +490,6 @@ internal class ScheduleDecoder(
         private const val MAKESPAN_WEIGHT = 100L
         private const val INVALID_START_TIME = 1_000_000
         private const val DEFAULT_DURATION = 10
+        private const val NO_ESTIMATION = Int.MIN_VALUE
     }
 }